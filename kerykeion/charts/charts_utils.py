@@ -6,6 +6,22 @@ from kerykeion.kr_types.kr_models import AspectModel, KerykeionPointModel
 from kerykeion.kr_types.settings_models import KerykeionLanguageCelestialPointModel, KerykeionSettingsAspectModel
 
 
+# Angle of a single zodiac slice and degrees to radians factor, folded once at import time
+_PI_OVER_6 = math.pi / 6
+_DEG2RAD = math.pi / 180
+
+# Chart types drawn as a double wheel, with the second subject on the outer ring
+_TRANSIT_LIKE = frozenset(("Transit", "Synastry"))
+
+# Module level aliases of the trigonometric functions used by the coordinates helpers
+_cos = math.cos
+_sin = math.sin
+
+# Cosine and sine of the 72 fixed 5° steps drawn by the degree rings
+_RING_COS = tuple(math.cos(math.radians(i * 5)) for i in range(72))
+_RING_SIN = tuple(math.sin(math.radians(i * 5)) for i in range(72))
+
+
 def get_decoded_kerykeion_celestial_point_name(input_planet_name: str, celestial_point_language: KerykeionLanguageCelestialPointModel) -> str:
     """
     Decode the given celestial point name based on the provided language model.
@@ -48,11 +64,7 @@ def decHourJoin(inH: int, inM: int, inS: int) -> float:
         float: hour in float format
     """
 
-    dh = float(inH)
-    dm = float(inM) / 60
-    ds = float(inS) / 3600
-    output = dh + dm + ds
-    return output
+    return inH + inM / 60 + inS / 3600
 
 
 def degreeDiff(a: Union[int, float], b: Union[int, float]) -> float:
@@ -66,14 +78,8 @@ def degreeDiff(a: Union[int, float], b: Union[int, float]) -> float:
         float: difference between a and b
     """
 
-    out = float()
-    if a > b:
-        out = a - b
-    if a < b:
-        out = b - a
-    if out > 180.0:
-        out = 360.0 - out
-    return out
+    out = abs(a - b)
+    return 360.0 - out if out > 180.0 else out
 
 
 def offsetToTz(datetime_offset: Union[datetime.timedelta, None]) -> float:
@@ -89,13 +95,7 @@ def offsetToTz(datetime_offset: Union[datetime.timedelta, None]) -> float:
     if datetime_offset is None:
         raise KerykeionException("datetime_offset is None")
 
-    # days to hours
-    dh = float(datetime_offset.days * 24)
-    # seconds to hours
-    sh = float(datetime_offset.seconds / 3600.0)
-    # total hours
-    output = dh + sh
-    return output
+    return datetime_offset.total_seconds() / 3600.0
 
 
 def sliceToX(slice: Union[int, float], radius: Union[int, float], offset: Union[int, float]) -> float:
@@ -118,9 +118,7 @@ def sliceToX(slice: Union[int, float], radius: Union[int, float], offset: Union[
         2.5000000000000018
     """
 
-    plus = (math.pi * offset) / 180
-    radial = ((math.pi / 6) * slice) + plus
-    return radius * (math.cos(radial) + 1)
+    return sliceToXY(slice, radius, offset)[0]
 
 
 def sliceToY(slice: Union[int, float], r: Union[int, float], offset: Union[int, float]) -> float:
@@ -141,9 +139,63 @@ def sliceToY(slice: Union[int, float], r: Union[int, float], offset: Union[int,
         >>> __sliceToY(3, 5, 45)
         -4.330127018922194
     """
-    plus = (math.pi * offset) / 180
-    radial = ((math.pi / 6) * slice) + plus
-    return r * ((math.sin(radial) / -1) + 1)
+    return sliceToXY(slice, r, offset)[1]
+
+
+def sliceToXY(
+    slice: Union[int, float],
+    radius: Union[int, float],
+    offset: Union[int, float],
+    translation: Union[int, float] = 0,
+) -> tuple[float, float]:
+    """Calculates both coordinates of a point on a circle based on the slice, radius, and offset,
+    sharing the angle between the cosine and the sine.
+
+    Args:
+        - slice (int | float): Represents the slice of the circle to calculate
+            the coordinates for. It must be between 0 and 11 (inclusive).
+        - radius (int | float): Represents the radius of the circle.
+        - offset (int | float): Represents the offset in degrees.
+            It must be between 0 and 360 (inclusive).
+        - translation (int | float): Added to both coordinates. Defaults to 0.
+
+    Returns:
+        tuple[float, float]: The x and y coordinates of the point on the circle.
+    """
+
+    radial = _PI_OVER_6 * slice + _DEG2RAD * offset
+    return (
+        radius * (_cos(radial) + 1) + translation,
+        radius * (1 - _sin(radial)) + translation,
+    )
+
+
+def _ring_unit_points(seventh_house_degree_ut: Union[int, float]) -> list[tuple[float, float]]:
+    """Calculates the points of the 72 fixed 5° steps of the degree rings on a unit circle,
+    rotated by the seventh house degree.
+
+    The rotation uses the angle-addition formula on the precomputed step tables,
+    so the whole ring needs a single cosine and sine evaluation. The points are
+    returned in the same form as sliceToXY, so a step on a circle of radius r is
+    (r * x, r * y).
+
+    Args:
+        - seventh_house_degree_ut (int | float): The degree of the seventh house.
+
+    Returns:
+        list[tuple[float, float]]: The x and y coordinates of every step on the unit circle.
+    """
+
+    cos_offset = _cos(-_DEG2RAD * seventh_house_degree_ut)
+    sin_offset = _sin(-_DEG2RAD * seventh_house_degree_ut)
+
+    return [
+        (
+            (step_cos * cos_offset - step_sin * sin_offset) + 1,
+            1 - (step_sin * cos_offset + step_cos * sin_offset),
+        )
+        for step_cos, step_sin in zip(_RING_COS, _RING_SIN)
+    ]
 
 
 def draw_zodiac_slice(
@@ -173,25 +225,87 @@ def draw_zodiac_slice(
         - str: The zodiac slice and symbol as an SVG path.
     """
 
+    is_transit_like = chart_type in _TRANSIT_LIKE
+
     # pie slices
     offset = 360 - seventh_house_degree_ut
     # check transit
-    if chart_type == "Transit" or chart_type == "Synastry":
+    if is_transit_like:
         dropin: Union[int, float] = 0
     else:
         dropin = c1
-    slice = f'<path d="M{str(r)},{str(r)} L{str(dropin + sliceToX(num, r - dropin, offset))},{str(dropin + sliceToY(num, r - dropin, offset))} A{str(r - dropin)},{str(r - dropin)} 0 0,0 {str(dropin + sliceToX(num + 1, r - dropin, offset))},{str(dropin + sliceToY(num + 1, r - dropin, offset))} z" style="{style}"/>'
+    start = sliceToXY(num, r - dropin, offset, dropin)
+    end = sliceToXY(num + 1, r - dropin, offset, dropin)
 
     # symbols
     offset = offset + 15
     # check transit
-    if chart_type == "Transit" or chart_type == "Synastry":
-        dropin = 54
+    if is_transit_like:
+        symbol_dropin: Union[int, float] = 54
     else:
-        dropin = 18 + c1
-    sign = f'<g transform="translate(-16,-16)"><use x="{str(dropin + sliceToX(num, r - dropin, offset))}" y="{str(dropin + sliceToY(num, r - dropin, offset))}" xlink:href="#{type}" /></g>'
+        symbol_dropin = 18 + c1
+    symbol = sliceToXY(num, r - symbol_dropin, offset, symbol_dropin)
+
+    return _format_zodiac_slice(r, r - dropin, start, end, symbol, style, type)
+
+
+def draw_all_zodiac_slices(
+    c1: Union[int, float],
+    chart_type: ChartType,
+    seventh_house_degree_ut: Union[int, float],
+    r: Union[int, float],
+    styles: list[str],
+    types: list[str],
+) -> str:
+    """Draws the 12 zodiac slices of a chart at once.
+
+    Consecutive slices share their boundary, so the 13 boundary points are computed
+    only once instead of twice as with 12 calls to draw_zodiac_slice.
+
+    Args:
+        - c1 (Union[int, float]): The value of c1.
+        - chart_type (ChartType): The type of chart.
+        - seventh_house_degree_ut (Union[int, float]): The degree of the seventh house.
+        - r (Union[int, float]): The value of r.
+        - styles (list[str]): The CSS inline style of every slice, starting with Aries.
+        - types (list[str]): The symbol of every sign, starting with Aries. Eg: "Ari".
+
+    Returns:
+        - str: The zodiac slices and symbols as SVG paths.
+    """
+
+    is_transit_like = chart_type in _TRANSIT_LIKE
 
-    return slice + "" + sign
+    # pie slices
+    offset = 360 - seventh_house_degree_ut
+    dropin: Union[int, float] = 0 if is_transit_like else c1
+    boundaries = [sliceToXY(num, r - dropin, offset, dropin) for num in range(13)]
+
+    # symbols
+    symbol_dropin: Union[int, float] = 54 if is_transit_like else 18 + c1
+    symbols = [sliceToXY(num, r - symbol_dropin, offset + 15, symbol_dropin) for num in range(12)]
+
+    return "".join(
+        _format_zodiac_slice(r, r - dropin, boundaries[num], boundaries[num + 1], symbols[num], styles[num], types[num])
+        for num in range(12)
+    )
+
+
+def _format_zodiac_slice(
+    r: Union[int, float],
+    slice_radius: Union[int, float],
+    start: tuple[float, float],
+    end: tuple[float, float],
+    symbol: tuple[float, float],
+    style: str,
+    type: str,
+) -> str:
+    """Formats the SVG of a zodiac slice and its symbol from the precomputed points."""
+
+    return (
+        f'<path d="M{r},{r} L{start[0]},{start[1]} A{slice_radius},{slice_radius} 0 0,0 {end[0]},{end[1]} z" style="{style}"/>'
+        f'<g transform="translate(-16,-16)"><use x="{symbol[0]}" y="{symbol[1]}" xlink:href="#{type}" /></g>'
+    )
 
 
 def convert_latitude_coordinate_to_string(coord: Union[int, float], north_label: str, south_label: str) -> str:
@@ -213,8 +327,9 @@ def convert_latitude_coordinate_to_string(coord: Union[int, float], north_label:
         sign = south_label
         coord = abs(coord)
     deg = int(coord)
-    min = int((float(coord) - deg) * 60)
-    sec = int(round(float(((float(coord) - deg) * 60) - min) * 60.0))
+    total_minutes = (coord - deg) * 60.0
+    min = int(total_minutes)
+    sec = int(round((total_minutes - min) * 60.0))
     return f"{deg}°{min}'{sec}\" {sign}"
 
 
@@ -237,8 +352,9 @@ def convert_longitude_coordinate_to_string(coord: Union[int, float], east_label:
         sign = west_label
         coord = abs(coord)
     deg = int(coord)
-    min = int((float(coord) - deg) * 60)
-    sec = int(round(float(((float(coord) - deg) * 60) - min) * 60.0))
+    total_minutes = (coord - deg) * 60.0
+    min = int(total_minutes)
+    sec = int(round((total_minutes - min) * 60.0))
     return f"{deg}°{min}'{sec}\" {sign}"
 
 
@@ -265,13 +381,16 @@ def draw_aspect_line(
     if isinstance(aspect, dict):
         aspect = AspectModel(**aspect)
 
-    first_offset = (int(seventh_house_degree_ut) / -1) + int(aspect["p1_abs_pos"])
-    x1 = sliceToX(0, ar, first_offset) + (r - ar)
-    y1 = sliceToY(0, ar, first_offset) + (r - ar)
+    # Positions are truncated to whole degrees, like the planets they connect
+    seventh_house_degree = int(seventh_house_degree_ut)
+
+    first_offset = int(aspect["p1_abs_pos"]) - seventh_house_degree
+    translation = r - ar
+
+    x1, y1 = sliceToXY(0, ar, first_offset, translation)
 
-    second_offset = (int(seventh_house_degree_ut) / -1) + int(aspect["p2_abs_pos"])
-    x2 = sliceToX(0, ar, second_offset) + (r - ar)
-    y2 = sliceToY(0, ar, second_offset) + (r - ar)
+    second_offset = int(aspect["p2_abs_pos"]) - seventh_house_degree
+    x2, y2 = sliceToXY(0, ar, second_offset, translation)
 
     return (
         f'<g kr:node="Aspect" kr:aspectname="{aspect["aspect"]}" kr:to="{aspect["p1_name"]}" kr:tooriginaldegrees="{aspect["p1_abs_pos"]}" kr:from="{aspect["p2_name"]}" kr:fromoriginaldegrees="{aspect["p2_abs_pos"]}">'
@@ -314,10 +433,10 @@ def draw_elements_percentages(
 
     return (
         f'<g transform="translate(-30,79)">'
-        f'<text y="0" style="fill: var(--kerykeion-chart-color-fire-percentage); font-size: 10px;">{fire_label}  {str(fire_percentage)}%</text>'
-        f'<text y="12" style="fill: var(--kerykeion-chart-color-earth-percentage); font-size: 10px;">{earth_label} {str(earth_percentage)}%</text>'
-        f'<text y="24" style="fill: var(--kerykeion-chart-color-air-percentage); font-size: 10px;">{air_label}   {str(air_percentage)}%</text>'
-        f'<text y="36" style="fill: var(--kerykeion-chart-color-water-percentage); font-size: 10px;">{water_label} {str(water_percentage)}%</text>'
+        f'<text y="0" style="fill: var(--kerykeion-chart-color-fire-percentage); font-size: 10px;">{fire_label}  {fire_percentage}%</text>'
+        f'<text y="12" style="fill: var(--kerykeion-chart-color-earth-percentage); font-size: 10px;">{earth_label} {earth_percentage}%</text>'
+        f'<text y="24" style="fill: var(--kerykeion-chart-color-air-percentage); font-size: 10px;">{air_label}   {air_percentage}%</text>'
+        f'<text y="36" style="fill: var(--kerykeion-chart-color-water-percentage); font-size: 10px;">{water_label} {water_percentage}%</text>'
         f"</g>"
     )
 
@@ -341,8 +460,9 @@ def convert_decimal_to_degree_string(dec: float, format_type: Literal["1", "2",
 
     # Calculate degrees, minutes, and seconds
     degrees = int(dec)
-    minutes = int((dec - degrees) * 60)
-    seconds = int(round((dec - degrees - minutes / 60) * 3600))
+    total_minutes = (dec - degrees) * 60
+    minutes = int(total_minutes)
+    seconds = int(round((total_minutes - minutes) * 60))
 
     # Format the output based on the specified type
     if format_type == "1":
@@ -364,21 +484,18 @@ def draw_transit_ring_degree_steps(r: Union[int, float], seventh_house_degree_ut
         str: The SVG path of the transit ring degree steps.
     """
 
-    out = '<g id="transitRingDegreeSteps">'
-    for i in range(72):
-        offset = float(i * 5) - seventh_house_degree_ut
-        if offset < 0:
-            offset = offset + 360.0
-        elif offset > 360:
-            offset = offset - 360.0
-        x1 = sliceToX(0, r, offset)
-        y1 = sliceToY(0, r, offset)
-        x2 = sliceToX(0, r + 2, offset) - 2
-        y2 = sliceToY(0, r + 2, offset) - 2
-        out += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: #F00; stroke-width: 1px; stroke-opacity:.9;"/>'
-    out += "</g>"
+    outer_radius = r + 2
 
-    return out
+    parts = ['<g id="transitRingDegreeSteps">']
+    for unit_x, unit_y in _ring_unit_points(seventh_house_degree_ut):
+        x1 = r * unit_x
+        y1 = r * unit_y
+        x2 = outer_radius * unit_x - 2
+        y2 = outer_radius * unit_y - 2
+        parts.append(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: #F00; stroke-width: 1px; stroke-opacity:.9;"/>')
+    parts.append("</g>")
+
+    return "".join(parts)
 
 
 def draw_degree_ring(
@@ -395,22 +512,20 @@ def draw_degree_ring(
     Returns:
         str: The SVG path of the degree ring.
     """
-    out = '<g id="degreeRing">'
-    for i in range(72):
-        offset = float(i * 5) - seventh_house_degree_ut
-        if offset < 0:
-            offset = offset + 360.0
-        elif offset > 360:
-            offset = offset - 360.0
-        x1 = sliceToX(0, r - c1, offset) + c1
-        y1 = sliceToY(0, r - c1, offset) + c1
-        x2 = sliceToX(0, r + 2 - c1, offset) - 2 + c1
-        y2 = sliceToY(0, r + 2 - c1, offset) - 2 + c1
-
-        out += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: {stroke_color}; stroke-width: 1px; stroke-opacity:.9;"/>'
-    out += "</g>"
+    inner_radius = r - c1
+    outer_radius = r + 2 - c1
 
-    return out
+    parts = ['<g id="degreeRing">']
+    for unit_x, unit_y in _ring_unit_points(seventh_house_degree_ut):
+        x1 = inner_radius * unit_x + c1
+        y1 = inner_radius * unit_y + c1
+        x2 = outer_radius * unit_x - 2 + c1
+        y2 = outer_radius * unit_y - 2 + c1
+
+        parts.append(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: {stroke_color}; stroke-width: 1px; stroke-opacity:.9;"/>')
+    parts.append("</g>")
+
+    return "".join(parts)
 
 
 def draw_transit_ring(r: Union[int, float], paper_1_color: str, zodiac_transit_ring_3_color: str) -> str:
@@ -448,7 +563,7 @@ def draw_first_circle(
     Returns:
         str: The SVG path of the first circle.
     """
-    if chart_type == "Synastry" or chart_type == "Transit":
+    if chart_type in _TRANSIT_LIKE:
         return f'<circle cx="{r}" cy="{r}" r="{r - 36}" style="fill: none; stroke: {stroke_color}; stroke-width: 1px; stroke-opacity:.4;" />'
     else:
         if c1 is None:
@@ -476,7 +591,7 @@ def draw_second_circle(
         str: The SVG path of the second circle.
     """
 
-    if chart_type == "Synastry" or chart_type == "Transit":
+    if chart_type in _TRANSIT_LIKE:
         return f'<circle cx="{r}" cy="{r}" r="{r - 72}" style="fill: {fill_color}; fill-opacity:.4; stroke: {stroke_color}; stroke-opacity:.4; stroke-width: 1px" />'
 
     else:
@@ -506,7 +621,7 @@ def draw_third_circle(
     Returns:
     - str: The SVG element as a string.
     """
-    if chart_type in {"Synastry", "Transit"}:
+    if chart_type in _TRANSIT_LIKE:
         # For Synastry and Transit charts, use a fixed radius adjustment of 160
         return f'<circle cx="{radius}" cy="{radius}" r="{radius - 160}" style="fill: {fill_color}; fill-opacity:.8; stroke: {stroke_color}; stroke-width: 1px" />'
 
@@ -534,7 +649,7 @@ def draw_aspect_grid(
     Returns:
         str: SVG string representing the aspect grid.
     """
-    svg_output = ""
+    parts = []
     style = f"stroke:{stroke_color}; stroke-width: 1px; stroke-width: 0.5px; fill:none"
     box_size = 14
 
@@ -544,10 +659,16 @@ def draw_aspect_grid(
     # Reverse the list of active planets for the first iteration
     reversed_planets = active_planets[::-1]
 
+    # Map both orderings of every aspect's pair of planets to its degrees
+    aspect_degrees_by_pair = {}
+    for aspect in aspects:
+        aspect_degrees_by_pair[(aspect["p1"], aspect["p2"])] = aspect["aspect_degrees"]
+        aspect_degrees_by_pair[(aspect["p2"], aspect["p1"])] = aspect["aspect_degrees"]
+
     for index, planet_a in enumerate(reversed_planets):
         # Draw the grid box for the planet
-        svg_output += f'<rect kr:node="AspectsGridRect" x="{x_start}" y="{y_start}" width="{box_size}" height="{box_size}" style="{style}"/>'
-        svg_output += f'<use transform="scale(0.4)" x="{(x_start + 2) * 2.5}" y="{(y_start + 1) * 2.5}" xlink:href="#{planet_a["name"]}" />'
+        parts.append(f'<rect kr:node="AspectsGridRect" x="{x_start}" y="{y_start}" width="{box_size}" height="{box_size}" style="{style}"/>')
+        parts.append(f'<use transform="scale(0.4)" x="{(x_start + 2) * 2.5}" y="{(y_start + 1) * 2.5}" xlink:href="#{planet_a["name"]}" />')
 
         # Update the starting coordinates for the next box
         x_start += box_size
@@ -560,17 +681,15 @@ def draw_aspect_grid(
         # Iterate over the remaining planets
         for planet_b in reversed_planets[index + 1:]:
             # Draw the grid box for the aspect
-            svg_output += f'<rect kr:node="AspectsGridRect" x="{x_aspect}" y="{y_aspect}" width="{box_size}" height="{box_size}" style="{style}"/>'
+            parts.append(f'<rect kr:node="AspectsGridRect" x="{x_aspect}" y="{y_aspect}" width="{box_size}" height="{box_size}" style="{style}"/>')
             x_aspect += box_size
 
-            # Check for aspects between the planets
-            for aspect in aspects:
-                if (aspect["p1"] == planet_a["id"] and aspect["p2"] == planet_b["id"]) or (
-                    aspect["p1"] == planet_b["id"] and aspect["p2"] == planet_a["id"]
-                ):
-                    svg_output += f'<use  x="{x_aspect - box_size + 1}" y="{y_aspect + 1}" xlink:href="#orb{aspect["aspect_degrees"]}" />'
+            # Check for an aspect between the planets
+            aspect_degrees = aspect_degrees_by_pair.get((planet_a["id"], planet_b["id"]))
+            if aspect_degrees is not None:
+                parts.append(f'<use  x="{x_aspect - box_size + 1}" y="{y_aspect + 1}" xlink:href="#orb{aspect_degrees}" />')
 
-    return svg_output
+    return "".join(parts)
 
 
 def draw_houses_cusps_and_text_number(
@@ -608,83 +727,125 @@ def draw_houses_cusps_and_text_number(
     - A string containing the SVG path for the houses cusps and text numbers.
     """
 
-    path = ""
+    parts = []
     xr = 12
 
-    for i in range(xr):
-        # Determine offsets based on chart type
-        dropin, roff, t_roff = (160, 72, 36) if chart_type in ["Transit", "Synastry"] else (c3, c1, False)
+    # Determine the chart type dependent values once for all the houses
+    is_transit_like = chart_type in _TRANSIT_LIKE
+    dropin, roff, t_roff = (160, 72, 36) if is_transit_like else (c3, c1, False)
+    text_dropin = {"Transit": 84, "Synastry": 84, "ExternalNatal": 100}.get(chart_type, 48)
+    t_fill_opacity = "0" if chart_type == "Transit" else ".4"
+    t_stroke_opacity = "0" if chart_type == "Transit" else ".3"
+
+    # Radii of the cusp lines ends and of the house numbers
+    r_dropin = r - dropin
+    r_roff = r - roff
+    r_text = r - text_dropin
+
+    # Line color of every cusp, the angular houses have their own colors
+    std = standard_house_cusp_color
+    cusp_colors = [
+        first_house_color, std, std,
+        fourth_house_color, std, std,
+        seventh_house_color, std, std,
+        tenth_house_color, std, std,
+    ]
+
+    # Precompute the cusp and house number offsets for all the houses in a single pass,
+    # pairing every cusp with the next one to get the middle of the house
+    first_abs_positions = [house.abs_pos for house in first_subject_houses_list]
+    first_next_abs_positions = first_abs_positions[1:] + first_abs_positions[:1]
+    half_ref = int(first_abs_positions[xr // 2])
+    first_offsets = [int(abs_pos) - half_ref for abs_pos in first_abs_positions]
+    first_text_offsets = [
+        offset + int(degreeDiff(next_abs_pos, abs_pos) / 2)
+        for offset, abs_pos, next_abs_pos in zip(first_offsets, first_abs_positions, first_next_abs_positions)
+    ]
+
+    if is_transit_like:
+        if second_subject_houses_list is None or transit_house_cusp_color is None:
+            raise KerykeionException("second_subject_houses_list_ut or transit_house_cusp_color is None")
+
+        r_t_roff = r - t_roff
+        r_t_text = r - 8
+
+        t_std = transit_house_cusp_color
+        t_cusp_colors = [
+            first_house_color, t_std, t_std,
+            fourth_house_color, t_std, t_std,
+            seventh_house_color, t_std, t_std,
+            tenth_house_color, t_std, t_std,
+        ]
+
+        # Offsets of the second subject's cusps, relative to the first subject's seventh house
+        zeropoint = 360 - first_abs_positions[6]
+        second_abs_positions = [house.abs_pos for house in second_subject_houses_list]
+        second_next_abs_positions = second_abs_positions[1:] + second_abs_positions[:1]
+        second_offsets = [(zeropoint + abs_pos) % 360 for abs_pos in second_abs_positions]
+        second_text_offsets = [
+            t_offset + int(degreeDiff(next_abs_pos, abs_pos) / 2)
+            for t_offset, abs_pos, next_abs_pos in zip(second_offsets, second_abs_positions, second_next_abs_positions)
+        ]
 
-        # Calculate the offset for the current house cusp
-        offset = (int(first_subject_houses_list[int(xr / 2)].abs_pos) / -1) + int(first_subject_houses_list[i].abs_pos)
+    for i in range(xr):
+        # Offset for the current house cusp
+        offset = first_offsets[i]
 
         # Calculate the coordinates for the house cusp lines
-        x1 = sliceToX(0, (r - dropin), offset) + dropin
-        y1 = sliceToY(0, (r - dropin), offset) + dropin
-        x2 = sliceToX(0, r - roff, offset) + roff
-        y2 = sliceToY(0, r - roff, offset) + roff
-
-        # Calculate the text offset for the house number
-        next_index = (i + 1) % xr
-        text_offset = offset + int(
-            degreeDiff(first_subject_houses_list[next_index].abs_pos, first_subject_houses_list[i].abs_pos) / 2
-        )
+        x1, y1 = sliceToXY(0, r_dropin, offset, dropin)
+        x2, y2 = sliceToXY(0, r_roff, offset, roff)
 
-        # Determine the line color based on the house index
-        linecolor = {0: first_house_color, 9: tenth_house_color, 6: seventh_house_color, 3: fourth_house_color}.get(
-            i, standard_house_cusp_color
-        )
+        # Text offset for the house number
+        text_offset = first_text_offsets[i]
 
-        if chart_type in ["Transit", "Synastry"]:
-            if second_subject_houses_list is None or transit_house_cusp_color is None:
-                raise KerykeionException("second_subject_houses_list_ut or transit_house_cusp_color is None")
+        # Line color based on the house index
+        linecolor = cusp_colors[i]
 
-            # Calculate the offset for the second subject's house cusp
-            zeropoint = 360 - first_subject_houses_list[6].abs_pos
-            t_offset = (zeropoint + second_subject_houses_list[i].abs_pos) % 360
+        if is_transit_like:
+            # Offset for the second subject's house cusp
+            t_offset = second_offsets[i]
 
             # Calculate the coordinates for the second subject's house cusp lines
-            t_x1 = sliceToX(0, (r - t_roff), t_offset) + t_roff
-            t_y1 = sliceToY(0, (r - t_roff), t_offset) + t_roff
-            t_x2 = sliceToX(0, r, t_offset)
-            t_y2 = sliceToY(0, r, t_offset)
-
-            # Calculate the text offset for the second subject's house number
-            t_text_offset = t_offset + int(
-                degreeDiff(second_subject_houses_list[next_index].abs_pos, second_subject_houses_list[i].abs_pos) / 2
-            )
-            t_linecolor = linecolor if i in [0, 9, 6, 3] else transit_house_cusp_color
-            xtext = sliceToX(0, (r - 8), t_text_offset) + 8
-            ytext = sliceToY(0, (r - 8), t_text_offset) + 8
+            t_x1, t_y1 = sliceToXY(0, r_t_roff, t_offset, t_roff)
+            t_x2, t_y2 = sliceToXY(0, r, t_offset)
+
+            # Text offset for the second subject's house number
+            t_text_offset = second_text_offsets[i]
+            t_linecolor = t_cusp_colors[i]
+            xtext, ytext = sliceToXY(0, r_t_text, t_text_offset, 8)
 
             # Add the house number text for the second subject
-            fill_opacity = "0" if chart_type == "Transit" else ".4"
-            path += f'<g kr:node="HouseNumber">'
-            path += f'<text style="fill: var(--kerykeion-chart-color-house-number); fill-opacity: {fill_opacity}; font-size: 14px"><tspan x="{xtext - 3}" y="{ytext + 3}">{i + 1}</tspan></text>'
-            path += f"</g>"
+            parts.append(
+                f'<g kr:node="HouseNumber">'
+                f'<text style="fill: var(--kerykeion-chart-color-house-number); fill-opacity: {t_fill_opacity}; font-size: 14px"><tspan x="{xtext - 3}" y="{ytext + 3}">{i + 1}</tspan></text>'
+                f"</g>"
+            )
 
             # Add the house cusp line for the second subject
-            stroke_opacity = "0" if chart_type == "Transit" else ".3"
-            path += f'<g kr:node="Cusp">'
-            path += f"<line x1='{t_x1}' y1='{t_y1}' x2='{t_x2}' y2='{t_y2}' style='stroke: {t_linecolor}; stroke-width: 1px; stroke-opacity:{stroke_opacity};'/>"
-            path += f"</g>"
+            parts.append(
+                f'<g kr:node="Cusp">'
+                f"<line x1='{t_x1}' y1='{t_y1}' x2='{t_x2}' y2='{t_y2}' style='stroke: {t_linecolor}; stroke-width: 1px; stroke-opacity:{t_stroke_opacity};'/>"
+                f"</g>"
+            )
 
-        # Adjust dropin based on chart type
-        dropin = {"Transit": 84, "Synastry": 84, "ExternalNatal": 100}.get(chart_type, 48)
-        xtext = sliceToX(0, (r - dropin), text_offset) + dropin
-        ytext = sliceToY(0, (r - dropin), text_offset) + dropin
+        # Calculate the coordinates for the house number
+        xtext, ytext = sliceToXY(0, r_text, text_offset, text_dropin)
 
         # Add the house cusp line for the first subject
-        path += f'<g kr:node="Cusp">'
-        path += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: {linecolor}; stroke-width: 1px; stroke-dasharray:3,2; stroke-opacity:.4;"/>'
-        path += f"</g>"
+        parts.append(
+            f'<g kr:node="Cusp">'
+            f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: {linecolor}; stroke-width: 1px; stroke-dasharray:3,2; stroke-opacity:.4;"/>'
+            f"</g>"
+        )
 
         # Add the house number text for the first subject
-        path += f'<g kr:node="HouseNumber">'
-        path += f'<text style="fill: var(--kerykeion-chart-color-house-number); fill-opacity: .6; font-size: 14px"><tspan x="{xtext - 3}" y="{ytext + 3}">{i + 1}</tspan></text>'
-        path += f"</g>"
+        parts.append(
+            f'<g kr:node="HouseNumber">'
+            f'<text style="fill: var(--kerykeion-chart-color-house-number); fill-opacity: .6; font-size: 14px"><tspan x="{xtext - 3}" y="{ytext + 3}">{i + 1}</tspan></text>'
+            f"</g>"
+        )
 
-    return path
+    return "".join(parts)
 
 
 def draw_transit_aspect_list(
@@ -864,7 +1025,7 @@ def draw_house_grid(
     - str: The SVG code for the grid of houses.
     """
     
-    if chart_type in ["Synastry", "Transit"] and secondary_subject_houses_list is None:
+    if chart_type in _TRANSIT_LIKE and secondary_subject_houses_list is None:
         raise KerykeionException("secondary_houses is None")
 
     svg_output = '<g transform="translate(610,-20)">'
@@ -963,7 +1124,7 @@ def draw_planet_grid(
         svg_output += end_of_line
         line_height += offset_between_lines
 
-    if chart_type in ["Transit", "Synastry"]:
+    if chart_type in _TRANSIT_LIKE:
         if second_subject_available_kerykeion_celestial_points is None:
             raise KerykeionException("second_subject_available_kerykeion_celestial_points is None")
 
@@ -1039,6 +1200,10 @@ def draw_transit_aspect_grid(
 
     # Reverse the list of active planets for the first iteration
     reversed_planets = active_planets[::-1]
+
+    # Map every aspect's ordered pair of planets to its degrees
+    aspect_degrees_by_pair = {(aspect["p1"], aspect["p2"]): aspect["aspect_degrees"] for aspect in aspects}
+
     for index, planet_a in enumerate(reversed_planets):
         # Draw the grid box for the planet
         svg_output += f'<rect x="{x_start}" y="{y_start}" width="{box_size}" height="{box_size}" style="{style}"/>'
@@ -1075,9 +1240,9 @@ def draw_transit_aspect_grid(
             svg_output += f'<rect x="{x_aspect}" y="{y_aspect}" width="{box_size}" height="{box_size}" style="{style}"/>'
             x_aspect += box_size
 
-            # Check for aspects between the planets
-            for aspect in aspects:
-                if (aspect["p1"] == planet_a["id"] and aspect["p2"] == planet_b["id"]):
-                    svg_output += f'<use  x="{x_aspect - box_size + 1}" y="{y_aspect + 1}" xlink:href="#orb{aspect["aspect_degrees"]}" />'
+            # Check for an aspect between the planets
+            aspect_degrees = aspect_degrees_by_pair.get((planet_a["id"], planet_b["id"]))
+            if aspect_degrees is not None:
+                svg_output += f'<use  x="{x_aspect - box_size + 1}" y="{y_aspect + 1}" xlink:href="#orb{aspect_degrees}" />'
 
     return svg_output
\ No newline at end of file
@@ -1,6 +1,6 @@
 # type: ignore
 
-from kerykeion.charts.charts_utils import degreeDiff, sliceToX, sliceToY, convert_decimal_to_degree_string
+from kerykeion.charts.charts_utils import degreeDiff, sliceToXY, convert_decimal_to_degree_string
 from kerykeion.kr_types import KerykeionException, ChartType, KerykeionPointModel
 from kerykeion.kr_types.settings_models import KerykeionSettingsCelestialPointModel
 from kerykeion.kr_types.kr_literals import Houses
@@ -230,28 +230,23 @@ def draw_planets(
         offset = (int(main_subject_seventh_house_degree_ut) / -1) + int(points_deg_ut[i] + planets_delta[e])
         trueoffset = (int(main_subject_seventh_house_degree_ut) / -1) + int(points_deg_ut[i])
 
-        planet_x = sliceToX(0, (radius - rplanet), offset) + rplanet
-        planet_y = sliceToY(0, (radius - rplanet), offset) + rplanet
+        planet_x, planet_y = sliceToXY(0, (radius - rplanet), offset, rplanet)
         if chart_type == "Transit" or chart_type == "Synastry":
             scale = 0.8
 
         elif chart_type == "ExternalNatal":
             scale = 0.8
             # line1
-            x1 = sliceToX(0, (radius - third_circle_radius), trueoffset) + third_circle_radius
-            y1 = sliceToY(0, (radius - third_circle_radius), trueoffset) + third_circle_radius
-            x2 = sliceToX(0, (radius - rplanet - 30), trueoffset) + rplanet + 30
-            y2 = sliceToY(0, (radius - rplanet - 30), trueoffset) + rplanet + 30
+            x1, y1 = sliceToXY(0, (radius - third_circle_radius), trueoffset, third_circle_radius)
+            x2, y2 = sliceToXY(0, (radius - rplanet - 30), trueoffset, rplanet + 30)
             color = available_planets_setting[i]["color"]
             output += (
                 '<line x1="%s" y1="%s" x2="%s" y2="%s" style="stroke-width:1px;stroke:%s;stroke-opacity:.3;"/>\n'
                 % (x1, y1, x2, y2, color)
             )
             # line2
-            x1 = sliceToX(0, (radius - rplanet - 30), trueoffset) + rplanet + 30
-            y1 = sliceToY(0, (radius - rplanet - 30), trueoffset) + rplanet + 30
-            x2 = sliceToX(0, (radius - rplanet - 10), offset) + rplanet + 10
-            y2 = sliceToY(0, (radius - rplanet - 10), offset) + rplanet + 10
+            x1, y1 = sliceToXY(0, (radius - rplanet - 30), trueoffset, rplanet + 30)
+            x2, y2 = sliceToXY(0, (radius - rplanet - 10), offset, rplanet + 10)
             output += (
                 '<line x1="%s" y1="%s" x2="%s" y2="%s" style="stroke-width:1px;stroke:%s;stroke-opacity:.5;"/>\n'
                 % (x1, y1, x2, y2, color)
@@ -339,18 +334,13 @@ def draw_planets(
 
             # Transit planet name
             zeropoint = 360 - main_subject_seventh_house_degree_ut
-            t_offset = zeropoint + t_points_deg_ut[i]
-            if t_offset > 360:
-                t_offset = t_offset - 360
-            planet_x = sliceToX(0, (radius - rplanet), t_offset) + rplanet
-            planet_y = sliceToY(0, (radius - rplanet), t_offset) + rplanet
+            t_offset = (zeropoint + t_points_deg_ut[i]) % 360
+            planet_x, planet_y = sliceToXY(0, (radius - rplanet), t_offset, rplanet)
             output += f'<g class="transit-planet-name" transform="translate(-6,-6)"><g transform="scale(0.5)"><use x="{planet_x*2}" y="{planet_y*2}" xlink:href="#{available_planets_setting[i]["name"]}" /></g></g>'
 
             # Transit planet line
-            x1 = sliceToX(0, radius + 3, t_offset) - 3
-            y1 = sliceToY(0, radius + 3, t_offset) - 3
-            x2 = sliceToX(0, radius - 3, t_offset) + 3
-            y2 = sliceToY(0, radius - 3, t_offset) + 3
+            x1, y1 = sliceToXY(0, radius + 3, t_offset, -3)
+            x2, y2 = sliceToXY(0, radius - 3, t_offset, 3)
             output += f'<line class="transit-planet-line" x1="{str(x1)}" y1="{str(y1)}" x2="{str(x2)}" y2="{str(y2)}" style="stroke: {available_planets_setting[i]["color"]}; stroke-width: 1px; stroke-opacity:.8;"/>'
 
             # transit planet degree text
@@ -370,8 +360,7 @@ def draw_planets(
                 xo = 1
             else:
                 xo = -1
-            deg_x = sliceToX(0, (radius - rtext), t_offset + xo) + rtext
-            deg_y = sliceToY(0, (radius - rtext), t_offset + xo) + rtext
+            deg_x, deg_y = sliceToXY(0, (radius - rtext), t_offset + xo, rtext)
             degree = int(t_offset)
             output += f'<g transform="translate({deg_x},{deg_y})">'
             output += f'<text transform="rotate({rotate})" text-anchor="{textanchor}'
@@ -385,10 +374,8 @@ def draw_planets(
             dropin = 0
 
         # planet line
-        x1 = sliceToX(0, radius - (dropin + 3), offset) + (dropin + 3)
-        y1 = sliceToY(0, radius - (dropin + 3), offset) + (dropin + 3)
-        x2 = sliceToX(0, (radius - (dropin - 3)), offset) + (dropin - 3)
-        y2 = sliceToY(0, (radius - (dropin - 3)), offset) + (dropin - 3)
+        x1, y1 = sliceToXY(0, radius - (dropin + 3), offset, dropin + 3)
+        x2, y2 = sliceToXY(0, (radius - (dropin - 3)), offset, dropin - 3)
 
         output += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: {available_planets_setting[i]["color"]}; stroke-width: 2px; stroke-opacity:.6;"/>'
 
@@ -398,10 +385,8 @@ def draw_planets(
         else:
             dropin = 120
 
-        x1 = sliceToX(0, radius - dropin, offset) + dropin
-        y1 = sliceToY(0, radius - dropin, offset) + dropin
-        x2 = sliceToX(0, (radius - (dropin - 3)), offset) + (dropin - 3)
-        y2 = sliceToY(0, (radius - (dropin - 3)), offset) + (dropin - 3)
+        x1, y1 = sliceToXY(0, radius - dropin, offset, dropin)
+        x2, y2 = sliceToXY(0, (radius - (dropin - 3)), offset, dropin - 3)
         output += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: {available_planets_setting[i]["color"]}; stroke-width: 2px; stroke-opacity:.6;"/>'
 
     return output
@@ -17,7 +17,7 @@ from kerykeion.kr_types.kr_models import AstrologicalSubjectModel
 from kerykeion.kr_types.settings_models import KerykeionSettingsCelestialPointModel, KerykeionSettingsModel
 from kerykeion.kr_types.kr_literals import KerykeionChartTheme, KerykeionChartLanguage
 from kerykeion.charts.charts_utils import (
-    draw_zodiac_slice, 
+    draw_all_zodiac_slices,
     convert_latitude_coordinate_to_string, 
     convert_longitude_coordinate_to_string,
     draw_aspect_line,
@@ -248,19 +248,14 @@ class KerykeionChartSVG:
             str: The SVG string representing the zodiac circle.
         """
         sings = get_args(Sign)
-        output = ""
-        for i, sing in enumerate(sings):
-            output += draw_zodiac_slice(
-                c1=self.first_circle_radius,
-                chart_type=self.chart_type,
-                seventh_house_degree_ut=self.user.seventh_house.abs_pos,
-                num=i,
-                r=r,
-                style=f'fill:{self.chart_colors_settings[f"zodiac_bg_{i}"]}; fill-opacity: 0.5;',
-                type=sing,
-            )
-
-        return output
+        return draw_all_zodiac_slices(
+            c1=self.first_circle_radius,
+            chart_type=self.chart_type,
+            seventh_house_degree_ut=self.user.seventh_house.abs_pos,
+            r=r,
+            styles=[f'fill:{self.chart_colors_settings[f"zodiac_bg_{i}"]}; fill-opacity: 0.5;' for i in range(len(sings))],
+            types=list(sings),
+        )
 
     def _calculate_elements_points_from_planets(self):
         """